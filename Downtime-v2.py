@@ -3,12 +3,23 @@
 import subprocess
 import platform
 import time
+import os
+import itertools
+import select
+import struct
+import re
+import math
+import mmap
+from array import array
 import signal
 import sys
+import atexit
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 import csv
 import socket
+from concurrent.futures import Future, as_completed, TimeoutError as FuturesTimeoutError
 
 
 PING_TARGETS = [
@@ -27,23 +38,122 @@ CHECK_INTERVAL = 2
 PING_TIMEOUT = 3
 FAILURE_THRESHOLD = 3
 
+PROBE_METHOD = "auto"
+TCP_PROBE_PORT = 53
+DNS_CONNECT_PORT = 443
+DNS_REFRESH_INTERVAL = 900
+
+IS_WINDOWS = platform.system().lower() == 'windows'
+
+if IS_WINDOWS:
+    PING_CMD_PREFIX = ['ping', '-n', '1', '-l', '32', '-w']
+    _PING_ENV = None
+    _RTT_RE = re.compile(r'time[=<]\s*(\d+(?:\.\d+)?)')
+else:
+    PING_CMD_PREFIX = ['ping', '-c', '1', '-s', '32', '-W']
+    _PING_ENV = {'PATH': '/usr/bin:/bin:/usr/sbin:/sbin'}
+    _RTT_RE = re.compile(r'time=\s*(\d+(?:\.\d+)?)')
+
 LOG_DIR = Path("network_logs")
 TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S %Z"
+CSV_MAP_SIZE = 4 << 20
+LOG_FLUSH_EVENTS = 32
+LOG_FLUSH_INTERVAL = 5
+LOG_SUCCESS = False
+HEARTBEAT_INTERVAL = 60
+
+_timestamp_cache = (None, "")
+
+
+def current_timestamp():
+    global _timestamp_cache
+    second = int(time.time())
+    cached_second, text = _timestamp_cache
+    if second != cached_second:
+        text = datetime.fromtimestamp(second).strftime(TIMESTAMP_FORMAT)
+        _timestamp_cache = (second, text)
+    return text
+
+
+class _MappedFile:
+    
+    def __init__(self, path, size=CSV_MAP_SIZE):
+        self._fd = os.open(str(path), os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        self._size = size
+        self._offset = 0
+        os.ftruncate(self._fd, size)
+        self._map = mmap.mmap(self._fd, size)
+        self.closed = False
+    
+    def write(self, data):
+        end = self._offset + len(data)
+        if end > self._size:
+            self._grow(end)
+        self._map[self._offset:end] = data
+        self._offset = end
+        return len(data)
+    
+    def _grow(self, needed):
+        size = self._size
+        while size < needed:
+            size *= 2
+        
+        self._map.close()
+        os.ftruncate(self._fd, size)
+        self._map = mmap.mmap(self._fd, size)
+        self._size = size
+    
+    def flush(self):
+        self._map.flush()
+    
+    def close(self):
+        self._map.flush()
+        self._map.close()
+        os.ftruncate(self._fd, self._offset)
+        os.close(self._fd)
+        self.closed = True
+
+
+class _EncodingWriter:
+    
+    def __init__(self, raw):
+        self._raw = raw
+    
+    def write(self, text):
+        return self._raw.write(text.encode('utf-8'))
 
 
 class NetworkMonitor:
     
+    __slots__ = (
+        'start_time', '_start_monotonic', 'is_online', 'current_outage_start',
+        '_outage_start_monotonic', 'consecutive_failures',
+        'total_checks', 'successful_checks', 'failed_checks',
+        '_outage_start', '_outage_end', '_outage_duration', '_outage_ongoing',
+        '_rt_count', '_rt_mean', '_rt_m2',
+        'log_dir', 'log_file', 'csv_file',
+        '_log_fd', '_log_buffer', '_csv_fh', '_csv_writer', '_pending',
+        '_last_flush_t', 'log_success', '_last_summary_t'
+    )
+    
     def __init__(self):
         self.start_time = datetime.now()
+        self._start_monotonic = time.monotonic()
         self.is_online = True
         self.current_outage_start = None
+        self._outage_start_monotonic = None
         self.consecutive_failures = 0
         
         self.total_checks = 0
         self.successful_checks = 0
         self.failed_checks = 0
-        self.outages = []
-        self.response_times = []
+        self._outage_start = array('d')
+        self._outage_end = array('d')
+        self._outage_duration = array('d')
+        self._outage_ongoing = array('b')
+        self._rt_count = 0
+        self._rt_mean = 0.0
+        self._rt_m2 = 0.0
         
         self.log_dir = LOG_DIR
         self.log_dir.mkdir(exist_ok=True)
@@ -52,28 +162,53 @@ class NetworkMonitor:
         self.log_file = self.log_dir / f"monitor_{timestamp}.log"
         self.csv_file = self.log_dir / f"monitor_{timestamp}.csv"
         
+        self._log_fd = os.open(str(self.log_file), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._log_buffer = bytearray()
+        self._csv_fh = _MappedFile(self.csv_file)
+        self._csv_writer = csv.writer(_EncodingWriter(self._csv_fh))
+        self._pending = 0
+        self._last_flush_t = time.monotonic()
+        self.log_success = LOG_SUCCESS
+        self._last_summary_t = time.monotonic()
+        atexit.register(self._close)
+        
         self._init_csv()
         self._log_event("MONITOR_START", "Network monitoring started")
     
     def _init_csv(self):
-        with open(self.csv_file, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                "Timestamp", "Status", "Target", "Response_Time_ms",
-                "Test_Type", "Details"
-            ])
+        self._csv_writer.writerow([
+            "Timestamp", "Status", "Target", "Response_Time_ms",
+            "Test_Type", "Details"
+        ])
     
     def _log_event(self, event_type, message, target="", response_time="", test_type=""):
-        timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
+        timestamp = current_timestamp()
         
-        with open(self.log_file, 'a') as f:
-            f.write(f"[{timestamp}] {event_type}: {message}\n")
+        self._log_buffer += f"[{timestamp}] {event_type}: {message}\n".encode('utf-8')
+        self._csv_writer.writerow([
+            timestamp, event_type, target, response_time, test_type, message
+        ])
         
-        with open(self.csv_file, 'a', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                timestamp, event_type, target, response_time, test_type, message
-            ])
+        self._pending += 1
+        if self._pending >= LOG_FLUSH_EVENTS:
+            self.flush()
+    
+    def flush(self):
+        data, self._log_buffer = self._log_buffer, bytearray()
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._log_fd, view):]
+        self._csv_fh.flush()
+        self._pending = 0
+        self._last_flush_t = time.monotonic()
+    
+    def _close(self):
+        if self._log_fd is not None:
+            self.flush()
+            os.close(self._log_fd)
+            self._log_fd = None
+        if not self._csv_fh.closed:
+            self._csv_fh.close()
     
     def record_check(self, success, target, response_time=None, test_type="PING", details=""):
         self.total_checks += 1
@@ -82,13 +217,19 @@ class NetworkMonitor:
             self.successful_checks += 1
             self.consecutive_failures = 0
             if response_time is not None:
-                self.response_times.append(response_time)
+                self._rt_count += 1
+                delta = response_time - self._rt_mean
+                self._rt_mean += delta / self._rt_count
+                self._rt_m2 += delta * (response_time - self._rt_mean)
             
             if not self.is_online:
                 self._transition_to_online()
             
-            self._log_event("SUCCESS", details or "Connection successful", 
-                          target, response_time or "", test_type)
+            if self.log_success:
+                self._log_event("SUCCESS", details or "Connection successful", 
+                              target, response_time or "", test_type)
+            else:
+                self._log_heartbeat()
         else:
             self.failed_checks += 1
             self.consecutive_failures += 1
@@ -97,207 +238,338 @@ class NetworkMonitor:
             
             if self.is_online and self.consecutive_failures >= FAILURE_THRESHOLD:
                 self._transition_to_offline()
+        
+        if self._pending and time.monotonic() - self._last_flush_t >= LOG_FLUSH_INTERVAL:
+            self.flush()
+    
+    def _log_heartbeat(self):
+        now = time.monotonic()
+        if now - self._last_summary_t < HEARTBEAT_INTERVAL:
+            return
+        
+        self._last_summary_t = now
+        self._log_event("HEARTBEAT", 
+                       f"n_ok={self.successful_checks} n_fail={self.failed_checks} avg_rtt={self._rt_mean:.1f}")
     
     def _transition_to_offline(self):
         self.is_online = False
         self.current_outage_start = datetime.now()
+        self._outage_start_monotonic = time.monotonic()
         self._log_event("OUTAGE_START", 
                        f"Network outage detected after {FAILURE_THRESHOLD} consecutive failures")
+        self.flush()
         print(f"\nOUTAGE DETECTED at {self.current_outage_start.strftime(TIMESTAMP_FORMAT)}")
     
     def _transition_to_online(self):
         self.is_online = True
         outage_end = datetime.now()
-        duration = outage_end - self.current_outage_start
+        duration_seconds = time.monotonic() - self._outage_start_monotonic
+        duration = timedelta(seconds=duration_seconds)
         
-        self.outages.append({
-            'start': self.current_outage_start,
-            'end': outage_end,
-            'duration': duration
-        })
+        self._outage_start.append(self.current_outage_start.timestamp())
+        self._outage_end.append(outage_end.timestamp())
+        self._outage_duration.append(duration_seconds)
+        self._outage_ongoing.append(0)
         
         self._log_event("OUTAGE_END", 
                        f"Network restored. Outage duration: {self._format_duration(duration)}")
+        self.flush()
         print(f"Connection restored at {outage_end.strftime(TIMESTAMP_FORMAT)}")
         print(f"Outage lasted: {self._format_duration(duration)}\n")
         
         self.current_outage_start = None
+        self._outage_start_monotonic = None
     
     @staticmethod
     def _format_duration(td):
-        total_seconds = int(td.total_seconds())
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
-        
-        parts = []
-        if hours > 0:
-            parts.append(f"{hours}h")
-        if minutes > 0:
-            parts.append(f"{minutes}m")
-        parts.append(f"{seconds}s")
+        minutes, seconds = divmod(int(td.total_seconds()), 60)
+        hours, minutes = divmod(minutes, 60)
         
-        return " ".join(parts)
+        if hours:
+            return f"{hours}h {minutes}m {seconds}s" if minutes else f"{hours}h {seconds}s"
+        if minutes:
+            return f"{minutes}m {seconds}s"
+        return f"{seconds}s"
     
     def generate_report(self):
         end_time = datetime.now()
-        total_runtime = end_time - self.start_time
+        end_monotonic = time.monotonic()
+        total_runtime = timedelta(seconds=end_monotonic - self._start_monotonic)
         
         if not self.is_online and self.current_outage_start:
-            ongoing_duration = end_time - self.current_outage_start
-            self.outages.append({
-                'start': self.current_outage_start,
-                'end': end_time,
-                'duration': ongoing_duration,
-                'ongoing': True
-            })
+            self._outage_start.append(self.current_outage_start.timestamp())
+            self._outage_end.append(end_time.timestamp())
+            self._outage_duration.append(end_monotonic - self._outage_start_monotonic)
+            self._outage_ongoing.append(1)
         
-        total_outage_time = sum((o['duration'] for o in self.outages), timedelta())
+        durations = self._outage_duration
+        total_outage_time = timedelta(seconds=sum(durations))
         total_uptime = total_runtime - total_outage_time
         uptime_percentage = (total_uptime.total_seconds() / total_runtime.total_seconds() * 100) if total_runtime.total_seconds() > 0 else 0
         
-        avg_response_time = sum(self.response_times) / len(self.response_times) if self.response_times else 0
-        
-        report = []
-        report.append("=" * 80)
-        report.append("NETWORK MONITORING REPORT")
-        report.append("=" * 80)
-        report.append("")
-        report.append("MONITORING PERIOD")
-        report.append(f"  Start Time:     {self.start_time.strftime(TIMESTAMP_FORMAT)}")
-        report.append(f"  End Time:       {end_time.strftime(TIMESTAMP_FORMAT)}")
-        report.append(f"  Total Duration: {self._format_duration(total_runtime)}")
-        report.append("")
-        report.append("CONNECTION SUMMARY")
-        report.append(f"  Total Checks:       {self.total_checks:,}")
-        report.append(f"  Successful Checks:  {self.successful_checks:,} ({self.successful_checks/self.total_checks*100:.2f}%)" if self.total_checks > 0 else "  Successful Checks:  0")
-        report.append(f"  Failed Checks:      {self.failed_checks:,} ({self.failed_checks/self.total_checks*100:.2f}%)" if self.total_checks > 0 else "  Failed Checks:      0")
-        report.append(f"  Avg Response Time:  {avg_response_time:.1f} ms")
-        report.append("")
-        report.append("UPTIME STATISTICS")
-        report.append(f"  Total Uptime:       {self._format_duration(total_uptime)} ({uptime_percentage:.2f}%)")
-        report.append(f"  Total Downtime:     {self._format_duration(total_outage_time)}")
-        report.append(f"  Number of Outages:  {len(self.outages)}")
-        report.append("")
-        
-        if self.outages:
-            report.append("OUTAGE DETAILS")
-            report.append("-" * 80)
-            for i, outage in enumerate(self.outages, 1):
-                ongoing_marker = " (ONGOING)" if outage.get('ongoing') else ""
-                report.append(f"  Outage #{i}{ongoing_marker}")
-                report.append(f"    Start:    {outage['start'].strftime(TIMESTAMP_FORMAT)}")
-                report.append(f"    End:      {outage['end'].strftime(TIMESTAMP_FORMAT)}")
-                report.append(f"    Duration: {self._format_duration(outage['duration'])}")
-                report.append("")
-            
-            if len(self.outages) > 1:
-                durations = [o['duration'].total_seconds() for o in self.outages]
-                avg_outage = sum(durations) / len(durations)
-                max_outage = max(durations)
-                min_outage = min(durations)
-                
-                report.append("  Outage Statistics")
-                report.append(f"    Average Duration: {self._format_duration(timedelta(seconds=avg_outage))}")
-                report.append(f"    Longest Outage:   {self._format_duration(timedelta(seconds=max_outage))}")
-                report.append(f"    Shortest Outage:  {self._format_duration(timedelta(seconds=min_outage))}")
-                report.append("")
-        
-        report.append("=" * 80)
-        report.append("LOG FILES")
-        report.append(f"  Detailed Log: {self.log_file}")
-        report.append(f"  CSV Data:     {self.csv_file}")
-        report.append("=" * 80)
-        
-        report_text = "\n".join(report)
+        avg_response_time = self._rt_mean
+        stddev_response_time = math.sqrt(self._rt_m2 / self._rt_count) if self._rt_count else 0
         
         report_file = self.log_dir / f"report_{end_time.strftime('%Y%m%d_%H%M%S')}.txt"
+        print()
         with open(report_file, 'w') as f:
-            f.write(report_text)
+            def write(line=""):
+                f.write(line + "\n")
+                sys.stdout.write(line + "\n")
+                
+            write("=" * 80)
+            write("NETWORK MONITORING REPORT")
+            write("=" * 80)
+            write()
+            write("MONITORING PERIOD")
+            write(f"  Start Time:     {self.start_time.strftime(TIMESTAMP_FORMAT)}")
+            write(f"  End Time:       {end_time.strftime(TIMESTAMP_FORMAT)}")
+            write(f"  Total Duration: {self._format_duration(total_runtime)}")
+            write()
+            write("CONNECTION SUMMARY")
+            write(f"  Total Checks:       {self.total_checks:,}")
+            write(f"  Successful Checks:  {self.successful_checks:,} ({self.successful_checks/self.total_checks*100:.2f}%)" if self.total_checks > 0 else "  Successful Checks:  0")
+            write(f"  Failed Checks:      {self.failed_checks:,} ({self.failed_checks/self.total_checks*100:.2f}%)" if self.total_checks > 0 else "  Failed Checks:      0")
+            write(f"  Avg Response Time:  {avg_response_time:.1f} ms")
+            write(f"  Response Std Dev:   {stddev_response_time:.1f} ms")
+            write()
+            write("UPTIME STATISTICS")
+            write(f"  Total Uptime:       {self._format_duration(total_uptime)} ({uptime_percentage:.2f}%)")
+            write(f"  Total Downtime:     {self._format_duration(total_outage_time)}")
+            write(f"  Number of Outages:  {len(durations)}")
+            write()
+            
+            if durations:
+                write("OUTAGE DETAILS")
+                write("-" * 80)
+                for i, (start, end, duration, ongoing) in enumerate(
+                        zip(self._outage_start, self._outage_end, durations, self._outage_ongoing), 1):
+                    ongoing_marker = " (ONGOING)" if ongoing else ""
+                    write(f"  Outage #{i}{ongoing_marker}")
+                    write(f"    Start:    {datetime.fromtimestamp(start).strftime(TIMESTAMP_FORMAT)}")
+                    write(f"    End:      {datetime.fromtimestamp(end).strftime(TIMESTAMP_FORMAT)}")
+                    write(f"    Duration: {self._format_duration(timedelta(seconds=duration))}")
+                    write()
+                
+                if len(durations) > 1:
+                    avg_outage = sum(durations) / len(durations)
+                    max_outage = max(durations)
+                    min_outage = min(durations)
+                    
+                    write("  Outage Statistics")
+                    write(f"    Average Duration: {self._format_duration(timedelta(seconds=avg_outage))}")
+                    write(f"    Longest Outage:   {self._format_duration(timedelta(seconds=max_outage))}")
+                    write(f"    Shortest Outage:  {self._format_duration(timedelta(seconds=min_outage))}")
+                    write()
+            
+            write("=" * 80)
+            write("LOG FILES")
+            write(f"  Detailed Log: {self.log_file}")
+            write(f"  CSV Data:     {self.csv_file}")
+            write("=" * 80)
         
-        print("\n" + report_text)
         print(f"\nReport saved to: {report_file}")
 
 
 def ping_host(host, timeout=PING_TIMEOUT):
-    param = '-n' if platform.system().lower() == 'windows' else '-c'
-    timeout_param = '-w' if platform.system().lower() == 'windows' else '-W'
-    size_param = '-l' if platform.system().lower() == 'windows' else '-s'
-    
-    command = ['ping', param, '1', size_param, '32', timeout_param, str(timeout), host]
+    command = PING_CMD_PREFIX + [str(timeout), host]
     
     try:
-        output = subprocess.check_output(
+        result = subprocess.run(
             command,
+            stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             universal_newlines=True,
-            timeout=timeout + 1
+            timeout=timeout + 1,
+            env=_PING_ENV,
+            close_fds=False
         )
-        
-        if platform.system().lower() == 'windows':
-            if 'time=' in output or 'time<' in output:
-                for line in output.split('\n'):
-                    if 'time' in line.lower():
-                        try:
-                            time_str = line.split('time')[1].split()[0]
-                            time_str = time_str.replace('=', '').replace('<', '').replace('ms', '')
-                            return True, float(time_str)
-                        except (IndexError, ValueError):
-                            pass
-        else:
-            if 'time=' in output:
-                for line in output.split('\n'):
-                    if 'time=' in line:
-                        try:
-                            time_str = line.split('time=')[1].split()[0]
-                            return True, float(time_str)
-                        except (IndexError, ValueError):
-                            pass
-        return True, None
-    
-    except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+    except (OSError, subprocess.TimeoutExpired):
+        return False, None
+    
+    if result.returncode != 0:
+        return False, None
+    
+    match = _RTT_RE.search(result.stdout)
+    return True, (float(match.group(1)) if match else None)
+
+
+_icmp_sequence = itertools.count(1)
+
+
+def _icmp_checksum(data):
+    if len(data) % 2:
+        data += b"\0"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def icmp_probe(host, timeout=PING_TIMEOUT):
+    ident = os.getpid() & 0xFFFF
+    sequence = next(_icmp_sequence) & 0xFFFF
+    payload = bytes(32)
+    checksum = _icmp_checksum(struct.pack("!BBHHH", 8, 0, 0, ident, sequence) + payload)
+    packet = struct.pack("!BBHHH", 8, 0, checksum, ident, sequence) + payload
+    
+    try:
+        address = socket.gethostbyname(host)
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP) as sock:
+            start = time.perf_counter()
+            deadline = start + timeout
+            sock.sendto(packet, (address, 0))
+            
+            while True:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    return False, None
+                
+                readable, _, _ = select.select([sock], [], [], remaining)
+                if not readable:
+                    return False, None
+                
+                reply, (source, _) = sock.recvfrom(1024)
+                if source != address:
+                    continue
+                if reply and reply[0] >> 4 == 4:
+                    reply = reply[(reply[0] & 0x0F) * 4:]
+                if len(reply) >= 8 and reply[0] == 0 and struct.unpack("!H", reply[6:8])[0] == sequence:
+                    return True, (time.perf_counter() - start) * 1000
+    
+    except OSError:
+        return False, None
+
+
+def tcp_probe(host, port=TCP_PROBE_PORT, timeout=PING_TIMEOUT):
+    start = time.perf_counter()
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            pass
+    except OSError:
         return False, None
+    return True, (time.perf_counter() - start) * 1000
 
 
-def test_dns_resolution(domain, timeout=PING_TIMEOUT):
+def icmp_available():
     try:
-        socket.setdefaulttimeout(timeout)
-        socket.gethostbyname(domain)
+        socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP).close()
         return True
-    except (socket.gaierror, socket.timeout):
+    except OSError:
         return False
 
 
-def perform_connectivity_test(monitor):
-    results = []
-    for target in PING_TARGETS:
-        success, response_time = ping_host(target)
-        results.append(success)
-        monitor.record_check(success, target, response_time, "ICMP_PING")
-        
-        if success:
-            break
-        time.sleep(0.5)
-    
-    if not any(results):
-        for domain in DNS_TEST_DOMAINS[:2]:
-            success = test_dns_resolution(domain)
-            results.append(success)
-            monitor.record_check(success, domain, test_type="DNS_RESOLUTION")
-            
+PROBES = {
+    "icmp": (icmp_probe, "ICMP_PING"),
+    "tcp": (tcp_probe, "TCP_CONNECT"),
+    "ping": (ping_host, "ICMP_PING"),
+}
+
+
+def select_probe(method=PROBE_METHOD):
+    if method == "auto":
+        method = "icmp" if icmp_available() else "tcp"
+    return PROBES[method]
+
+
+_DNS_CACHE = {}
+_DNS_NEGATIVE_TTL = 5
+
+
+def test_dns_resolution(domain):
+    entry = _DNS_CACHE.get(domain)
+    if entry and entry[1] is None and time.monotonic() - entry[0] < _DNS_NEGATIVE_TTL:
+        return False
+    
+    try:
+        addresses = socket.getaddrinfo(domain, None, family=socket.AF_INET, type=socket.SOCK_STREAM)
+    except OSError:
+        if not (entry and entry[1]):
+            _DNS_CACHE[domain] = (time.monotonic(), None)
+        return False
+    
+    _DNS_CACHE[domain] = (time.monotonic(), addresses[0][4][0])
+    return True
+
+
+def dns_probe(domain):
+    return test_dns_resolution(domain), None
+
+
+def cached_address(domain):
+    entry = _DNS_CACHE.get(domain)
+    return entry[1] if entry else None
+
+
+def refresh_dns_cache():
+    for domain in DNS_TEST_DOMAINS:
+        test_dns_resolution(domain)
+    
+    timer = threading.Timer(DNS_REFRESH_INTERVAL, refresh_dns_cache)
+    timer.daemon = True
+    timer.start()
+
+
+def submit_daemon(probe, *args):
+    future = Future()
+    
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(probe(*args))
+        except BaseException as exc:
+            future.set_exception(exc)
+    
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
+def record_first_success(monitor, futures, test_type, timeout=None):
+    failed = []
+    try:
+        for future in as_completed(futures, timeout=timeout):
+            success, response_time = future.result()
             if success:
-                break
-            time.sleep(0.5)
+                monitor.record_check(True, futures[future], response_time, test_type)
+                return True
+            failed.append(futures[future])
+    except FuturesTimeoutError:
+        failed = list(futures.values())
+    
+    for target in failed:
+        monitor.record_check(False, target, test_type=test_type)
+    return False
+
+
+def perform_connectivity_test(monitor):
+    pings = {submit_daemon(PROBE, target): target for target in PING_TARGETS}
+    if record_first_success(monitor, pings, PROBE_TYPE):
+        return True
     
-    return any(results)
+    addresses = {domain: cached_address(domain) for domain in DNS_TEST_DOMAINS[:2]}
+    connects = {submit_daemon(tcp_probe, ip, DNS_CONNECT_PORT): domain
+                for domain, ip in addresses.items() if ip}
+    lookups = {submit_daemon(dns_probe, domain): domain
+               for domain, ip in addresses.items() if not ip}
+    fallback_deadline = time.monotonic() + PING_TIMEOUT
+    
+    return (record_first_success(monitor, connects, "DNS_HOST_CONNECT",
+                                 fallback_deadline - time.monotonic())
+            or record_first_success(monitor, lookups, "DNS_RESOLUTION",
+                                    fallback_deadline - time.monotonic()))
 
 
 def end_signal(signum, frame):
     print("\n\nMonitoring stopped by user")
+    monitor.flush()
     monitor.generate_report()
     sys.exit(0)
 
 
+PROBE, PROBE_TYPE = select_probe()
+
+
 if __name__ == "__main__":
     print("=" * 80)
     print("NETWORK UPTIME MONITOR")
@@ -305,19 +577,28 @@ if __name__ == "__main__":
     print(f"Monitoring started at {datetime.now().strftime(TIMESTAMP_FORMAT)}")
     print(f"Check interval: {CHECK_INTERVAL} seconds")
     print(f"Test targets: {', '.join(PING_TARGETS)}")
+    print(f"Probe method: {PROBE_TYPE}")
     print(f"Logs directory: {LOG_DIR.absolute()}")
     print("\nPress Ctrl+C to stop monitoring and generate report")
     print("=" * 80)
     print()
     
     monitor = NetworkMonitor()
+    threading.Thread(target=refresh_dns_cache, daemon=True).start()
     
     signal.signal(signal.SIGINT, end_signal)
+    signal.signal(signal.SIGTERM, end_signal)
     
     try:
+        next_check = time.monotonic()
         while True:
             perform_connectivity_test(monitor)
-            time.sleep(CHECK_INTERVAL)
+            next_check += CHECK_INTERVAL
+            sleep_for = next_check - time.monotonic()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+            else:
+                next_check = time.monotonic()
     
     except KeyboardInterrupt:
 